@@ -1,24 +1,51 @@
+import copy
 import getpass
 import datetime
+import functools
 import os
+import threading
+import time
 import yaml
-import pytz
+import numpy as np
 import pandas as pd
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
+from concurrent.futures import ThreadPoolExecutor
 from uptime_kuma_api import UptimeKumaApi, UptimeKumaException
 from fpdf import FPDF
 from fpdf.enums import XPos, YPos
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 # --- Script Information ---
 __version__ = "1.7.0"
 __developer__ = "alteredgenome"
 CONFIG_FILE = "config.yml"
 LOGO_FILE = "logo.png"
+# Fetches share one connection and are serialized, so a second worker is
+# enough to overlap one monitor's analysis with the next monitor's fetch
+MAX_WORKERS = 2
+
+# Reporting windows shown in the summary table
+SUMMARY_PERIODS = {
+    "Daily": datetime.timedelta(days=1),
+    "Weekly": datetime.timedelta(days=7),
+    "Monthly": datetime.timedelta(days=30)
+}
+# get_monitor_beats takes a lookback in hours. Fetch the longest window plus a
+# lead-in, so an outage already running when that window opens keeps its start.
+BEAT_HISTORY_LEAD_IN = datetime.timedelta(days=7)
+BEAT_HISTORY_HOURS = (max(SUMMARY_PERIODS.values()) + BEAT_HISTORY_LEAD_IN) // datetime.timedelta(hours=1)
+
+# Parsed config files keyed by path, validated against (mtime, size)
+_YAML_CACHE = {}
 
 # --- ASCII Art Banner ---
-def print_banner():
-    """Prints a startup banner with ASCII art and script information."""
-    # Using an 'r' before the f-string (rf"...") treats backslashes as literal characters
-    banner = rf"""
+# Using an 'r' before the f-string (rf"...") treats backslashes as literal characters
+_BANNER = rf"""
                                __                       _
   /\_/\_   _ _ __ ___   __ _  /__\____ _ __   ___  _ __| |_
  / //_/ | | | '_ ` _ \_/ _` |/ \/// _ \_'_ \_ / _ \| '__| __|
@@ -30,28 +57,41 @@ def print_banner():
     (c) 2025 {__developer__}
     ====================================================
 """
-    print(banner)
+
+def print_banner():
+    """Prints a startup banner with ASCII art and script information."""
+    print(_BANNER)
 
 # --- Configuration Management ---
 
+def _read_yaml(path):
+    """Parses a YAML file, reusing the cached result while the file is unchanged."""
+    st = os.stat(path)
+    cached = _YAML_CACHE.get(path)
+    if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        return copy.deepcopy(cached[2])
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=SafeLoader)
+    _YAML_CACHE[path] = (st.st_mtime, st.st_size, data)
+    return copy.deepcopy(data)
+
 def load_config():
     """Loads configuration from config.yml if it exists and is valid."""
     if not os.path.exists(CONFIG_FILE):
         return None, None, None, None
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            config = yaml.safe_load(f)
-            # Basic validation
-            if config and 'url' in config and 'username' in config:
-                url = config['url']
-                username = config['username']
-                timezone = config.get('timezone', 'UTC')
-                export_format = config.get('export_format', 'pdf')
-                print(f"Loaded configuration from {CONFIG_FILE}.")
-                return url, username, timezone, export_format
-            else:
-                print(f"Warning: {CONFIG_FILE} is malformed. Will prompt for new values.")
-                return None, None, None, None
+        config = _read_yaml(CONFIG_FILE)
+        # Basic validation
+        if config and 'url' in config and 'username' in config:
+            url = config['url']
+            username = config['username']
+            timezone = config.get('timezone', 'UTC')
+            export_format = config.get('export_format', 'pdf')
+            print(f"Loaded configuration from {CONFIG_FILE}.")
+            return url, username, timezone, export_format
+        else:
+            print(f"Warning: {CONFIG_FILE} is malformed. Will prompt for new values.")
+            return None, None, None, None
     except (yaml.YAMLError, IOError) as e:
         print(f"Warning: Could not read {CONFIG_FILE}. Error: {e}. Will prompt for new values.")
         return None, None, None, None
@@ -66,7 +106,7 @@ def save_config(url, username, timezone, export_format):
     }
     try:
         with open(CONFIG_FILE, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False)
+            yaml.dump(config_data, f, Dumper=SafeDumper, default_flow_style=False)
         print(f"Configuration saved to {CONFIG_FILE} for future use.")
     except IOError as e:
         print(f"Error: Could not save configuration to {CONFIG_FILE}. Error: {e}")
@@ -100,110 +140,187 @@ def _format_timedelta(td):
     """Formats a timedelta object into a human-readable string."""
     if td is None:
         return "N/A"
-    days, remainder = divmod(td.total_seconds(), 86400)
-    hours, remainder = divmod(remainder, 3600)
-    minutes, seconds = divmod(remainder, 60)
-
-    parts = []
-    if days > 0:
-        parts.append(f"{int(days)}d")
-    if hours > 0:
-        parts.append(f"{int(hours)}h")
-    if minutes > 0:
-        parts.append(f"{int(minutes)}m")
-    if seconds > 0 or not parts:
-        parts.append(f"{int(seconds)}s")
-
-    return " ".join(parts)
+    seconds = int(td.total_seconds())
+    days, seconds = divmod(seconds, 86400)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+
+    parts = (
+        f"{days}d" if days > 0 else "",
+        f"{hours}h" if hours > 0 else "",
+        f"{minutes}m" if minutes > 0 else "",
+    )
+    if seconds > 0 or not any(parts):
+        parts += (f"{seconds}s",)
+
+    return " ".join(filter(None, parts))
+
+@functools.lru_cache(maxsize=None)
+def _resolve_timezone(name):
+    """
+    Resolves a timezone name, ignoring case as pytz did (e.g. 'america/new_york').
+    Falls back to UTC with a warning; cached so the warning is printed once.
+    """
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        pass
+    matches = [key for key in available_timezones() if key.lower() == str(name).lower()]
+    if matches:
+        return ZoneInfo(matches[0])
+    print(f"Warning: Unknown timezone '{name}'. Defaulting to UTC.")
+    return datetime.timezone.utc
 
 # --- Data Processing ---
 
-def analyze_heartbeats(heartbeats, user_timezone_str):
+# NaT as an int64 nanosecond value
+_NAT_NS = np.iinfo(np.int64).min
+
+def _to_ns(times):
+    """Returns naive datetimes as an int64 array of nanoseconds since the epoch."""
+    return times.to_numpy('datetime64[ns]').view(np.int64)
+
+def _parse_str_times_ns(times):
+    """Parses 'YYYY-MM-DD HH:MM:SS[.fff]' UTC strings into int64 nanoseconds."""
+    # Uptime Kuma stores 'YYYY-MM-DD HH:MM:SS.fff'; drop the fraction by slicing
+    times = times.astype(str).str.slice(stop=19)
+    return _to_ns(pd.to_datetime(times, format='%Y-%m-%d %H:%M:%S', errors='coerce', cache=True))
+
+def _parse_epoch_times_ns(times):
+    """Parses epoch seconds into int64 nanoseconds."""
+    return _to_ns(pd.to_datetime(pd.to_numeric(times, errors='coerce'), unit='s', errors='coerce'))
+
+def _parse_times_ns(times):
+    """
+    Parses heartbeat times into int64 nanoseconds since the epoch, with
+    _NAT_NS for values that cannot be parsed.
+    """
+    # Heartbeats normally carry only strings or only epoch numbers, so check
+    # the column once and take a single parser when it is uniform.
+    kind = pd.api.types.infer_dtype(times, skipna=False)
+    if kind == 'string':
+        return _parse_str_times_ns(times)
+    if kind in ('integer', 'floating', 'mixed-integer-float'):
+        return _parse_epoch_times_ns(times)
+
+    is_str = times.map(lambda v: isinstance(v, str)).to_numpy(bool)
+    is_num = times.map(lambda v: isinstance(v, (int, float))).to_numpy(bool)
+    ts = np.full(len(times), _NAT_NS, dtype=np.int64)
+    ts[is_str] = _parse_str_times_ns(times[is_str])
+    ts[is_num] = _parse_epoch_times_ns(times[is_num])
+    return ts
+
+def _scan_downtime(status):
+    """
+    Finds runs of DOWN beats in a status array.
+
+    Returns the start and end beat indices of each finished run, plus a flag
+    set when the last run is still down at the end of the data. The last
+    start index belongs to that ongoing run when the flag is set.
+    """
+    down = (status == 0).astype(np.int8)
+    edges = np.diff(np.concatenate(([0], down, [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    ongoing = len(ends) > 0 and ends[-1] == len(status)
+    if ongoing:
+        ends = ends[:-1]
+    return starts, ends, ongoing
+
+def analyze_heartbeats(heartbeats, user_timezone_str, history_start_ns=None):
     """
     Analyzes heartbeats to calculate downtime incidents and collect ping data.
+    Incidents are returned most recent first. history_start_ns is the start of
+    the fetched window, used to flag an outage whose start it cut off.
     """
-    try:
-        user_tz = pytz.timezone(user_timezone_str)
-    except pytz.UnknownTimeZoneError:
-        print(f"Warning: Unknown timezone '{user_timezone_str}'. Defaulting to UTC.")
-        user_tz = pytz.utc
-
-    def to_datetime(time_val):
-        if isinstance(time_val, str):
-            try:
-                naive_dt = datetime.datetime.strptime(time_val.split('.')[0], '%Y-%m-%d %H:%M:%S')
-                utc_dt = pytz.utc.localize(naive_dt)
-                return utc_dt.astimezone(user_tz)
-            except ValueError:
-                return None
-        elif isinstance(time_val, (int, float)):
-            utc_dt = datetime.datetime.fromtimestamp(float(time_val), tz=pytz.utc)
-            return utc_dt.astimezone(user_tz)
-        return None
-
-    processed_beats = []
-    ping_data = []
-    for beat in heartbeats:
-        dt = to_datetime(beat.get('time'))
-        if dt:
-            processed_beats.append({'datetime': dt, 'status': beat['status']})
-            if beat.get('ping') is not None:
-                ping_data.append({'datetime': dt, 'ping': beat['ping']})
-
-    beats = sorted(processed_beats, key=lambda x: x['datetime'])
-
-    incidents = []
-    current_downtime_start_dt = None
-
-    for beat in beats:
-        is_down = beat['status'] == 0
-        if is_down and current_downtime_start_dt is None:
-            current_downtime_start_dt = beat['datetime']
-        elif not is_down and current_downtime_start_dt is not None:
-            incidents.append({
-                "start": current_downtime_start_dt,
-                "duration": beat['datetime'] - current_downtime_start_dt
-            })
-            current_downtime_start_dt = None
-
-    if current_downtime_start_dt is not None:
-        now_aware = datetime.datetime.now(user_tz)
-        incidents.append({"start": current_downtime_start_dt, "duration": now_aware - current_downtime_start_dt, "ongoing": True})
-
-    return {"downtime_incidents": incidents, "ping_data": ping_data}
-
-def calculate_summary_stats(analysis_results, user_timezone_str):
-    """Calculates summary statistics for daily, weekly, and monthly periods."""
-    incidents = analysis_results['downtime_incidents']
-    ping_data = analysis_results['ping_data']
+    user_tz = _resolve_timezone(user_timezone_str)
+
+    # Only these keys are pulled out of the beat dicts
+    df = pd.DataFrame(list(heartbeats), columns=['time', 'status', 'ping'])
+
+    # Parse timestamps straight into naive UTC nanoseconds. Timezone
+    # conversion is left to the few values that actually end up in the report.
+    ts = _parse_times_ns(df['time'])
+
+    valid = ts != _NAT_NS
+    order = np.argsort(ts[valid], kind='stable')
+    ts = ts[valid][order]
+    df = df[valid].iloc[order].reset_index(drop=True)
+
+    pings = pd.to_numeric(df['ping'], errors='coerce').to_numpy(np.float64)
+    has_ping = ~np.isnan(pings)
+
+    # Scan on plain integer arrays; only the incident starts get localized.
+    status = pd.to_numeric(df['status'], errors='coerce').fillna(-1).to_numpy(np.int8)
+    starts, ends, ongoing = _scan_downtime(status)
+
+    starts_ns = ts[starts]
+    durations_ns = np.empty(len(starts), dtype=np.int64)
+    durations_ns[:len(ends)] = ts[ends] - starts_ns[:len(ends)]
+    if ongoing:
+        durations_ns[-1] = time.time_ns() - starts_ns[-1]
+    # Whole microseconds, matching timedelta resolution
+    durations_s = (durations_ns // 1000) / 1e6
+
+    start_dts = pd.to_datetime(starts_ns, utc=True).tz_convert(user_tz).to_pydatetime()
+    incidents = [
+        {"start": start_dt, "duration_s": duration_s}
+        for start_dt, duration_s in zip(start_dts, durations_s.tolist())
+    ]
+    if ongoing:
+        incidents[-1]["ongoing"] = True
+    # A run that is already down at the first fetched beat, when that beat sits
+    # at the edge of the fetch window, started before the fetched history; its
+    # start and duration are only lower bounds. A monitor whose history simply
+    # begins later (e.g. one created inside the window) is not flagged.
+    if history_start_ns is not None and len(starts) and starts[0] == 0:
+        beat_interval_ns = np.median(np.diff(ts)) if len(ts) > 1 else 0
+        if ts[0] - history_start_ns <= beat_interval_ns:
+            incidents[0]["truncated"] = True
+    # Every report lists incidents most recent first
+    incidents.reverse()
+
+    return {
+        "downtime_incidents": incidents,
+        "incident_starts_ns": starts_ns,
+        "incident_durations_s": durations_s,
+        "ping_times_ns": ts[has_ping],
+        "pings": pings[has_ping]
+    }
 
-    try:
-        user_tz = pytz.timezone(user_timezone_str)
-    except pytz.UnknownTimeZoneError:
-        user_tz = pytz.utc
-
-    now = datetime.datetime.now(user_tz)
-    periods = {
-        "Daily": datetime.timedelta(days=1),
-        "Weekly": datetime.timedelta(days=7),
-        "Monthly": datetime.timedelta(days=30)
+def get_period_starts():
+    """Returns the start of each summary period, in nanoseconds since the epoch."""
+    now_ns = time.time_ns()
+    return {
+        name: now_ns - delta // datetime.timedelta(microseconds=1) * 1000
+        for name, delta in SUMMARY_PERIODS.items()
     }
 
+def calculate_summary_stats(analysis_results, period_starts):
+    """
+    Calculates summary statistics for daily, weekly, and monthly periods.
+    period_starts comes from get_period_starts() so every monitor shares one "now".
+    """
+    starts_ns = analysis_results['incident_starts_ns']
+    durations_s = analysis_results['incident_durations_s']
+    ping_times_ns = analysis_results['ping_times_ns']
+    pings = analysis_results['pings']
+
     summary = {}
-    for name, delta in periods.items():
-        period_start = now - delta
+    for name, delta in SUMMARY_PERIODS.items():
+        period_start_ns = period_starts[name]
 
         # Downtime stats
-        period_incidents = [inc for inc in incidents if inc['start'] >= period_start]
-        count = len(period_incidents)
-        total_duration = sum([inc['duration'] for inc in period_incidents], datetime.timedelta())
-        avg_duration = total_duration / count if count > 0 else datetime.timedelta(0)
-        percentage = (total_duration.total_seconds() / delta.total_seconds()) * 100 if delta.total_seconds() > 0 else 0
+        period_durations = durations_s[starts_ns >= period_start_ns]
+        count = len(period_durations)
+        total_seconds = period_durations.sum()
+        avg_duration = datetime.timedelta(seconds=total_seconds / count) if count > 0 else datetime.timedelta(0)
+        percentage = (total_seconds / delta.total_seconds()) * 100 if delta.total_seconds() > 0 else 0
 
         # Ping stats
-        period_pings = [p['ping'] for p in ping_data if p['datetime'] >= period_start]
-        avg_ping = sum(period_pings) / len(period_pings) if period_pings else None
-        max_ping = max(period_pings) if period_pings else None
+        period_pings = pings[ping_times_ns >= period_start_ns]
+        avg_ping = period_pings.mean() if len(period_pings) else None
+        max_ping = period_pings.max() if len(period_pings) else None
 
         summary[name] = {
             "count": count,
@@ -217,7 +334,7 @@ def calculate_summary_stats(analysis_results, user_timezone_str):
 
 # --- Report Generation ---
 
-def generate_pdf_report(username, selected_monitors, timezone, all_monitor_data):
+def generate_pdf_report(username, selected_monitors, timezone, all_monitor_data, filename):
     """Generates the full report in PDF format."""
     pdf = FPDF()
     pdf.add_page()
@@ -231,59 +348,68 @@ def generate_pdf_report(username, selected_monitors, timezone, all_monitor_data)
         if i < len(all_monitor_data) - 1:
             pdf.add_page()
 
-    filename = datetime.datetime.now().strftime("kumareport_%m_%d_%y_%H_%M_%S.pdf")
     pdf.output(filename)
     return filename
 
-def generate_csv_report(all_monitor_data):
-    """Generates a CSV report from the analyzed data."""
-    all_data_rows = []
+def _build_incident_frame(all_monitor_data):
+    """Builds the downtime log shared by the CSV and XLSX reports."""
+    total = sum(len(data['downtime_incidents']) for data in all_monitor_data)
+    names = [None] * total
+    starts = [None] * total
+    durations = [0.0] * total
+    ongoing = [False] * total
+    truncated = [False] * total
+
+    i = 0
     for data in all_monitor_data:
-        for incident in reversed(data['downtime_incidents']):
-            all_data_rows.append({
-                "Monitor Name": data['monitor_name'],
-                "Outage Start": incident['start'].strftime('%Y-%m-%d %H:%M:%S %Z'),
-                "Duration (seconds)": incident['duration'].total_seconds(),
-                "Ongoing": incident.get("ongoing", False)
-            })
-
-    df = pd.DataFrame(all_data_rows)
-    filename = datetime.datetime.now().strftime("kumareport_%m_%d_%y_%H_%M_%S.csv")
-    df.to_csv(filename, index=False)
+        for incident in data['downtime_incidents']:
+            names[i] = data['monitor_name']
+            starts[i] = incident['start']
+            durations[i] = incident['duration_s']
+            ongoing[i] = incident.get("ongoing", False)
+            truncated[i] = incident.get("truncated", False)
+            i += 1
+
+    return pd.DataFrame({
+        "Monitor Name": names,
+        "Outage Start": pd.DatetimeIndex(starts).strftime('%Y-%m-%d %H:%M:%S %Z'),
+        "Duration (s)": durations,
+        "Ongoing": ongoing,
+        "Start Truncated": truncated
+    })
+
+def generate_csv_report(all_monitor_data, filename):
+    """Generates a CSV report from the analyzed data."""
+    incidents_df = _build_incident_frame(all_monitor_data)
+    incidents_df.rename(columns={"Duration (s)": "Duration (seconds)"}).to_csv(filename, index=False)
     return filename
 
-def generate_xlsx_report(all_monitor_data):
+def generate_xlsx_report(all_monitor_data, filename):
     """Generates an XLSX report with separate sheets for summary and details."""
-    filename = datetime.datetime.now().strftime("kumareport_%m_%d_%y_%H_%M_%S.xlsx")
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+    with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
         # Summary Sheet
-        summary_rows = []
+        summary = {
+            "Monitor Name": [],
+            "Period": [],
+            "Downtime Incidents": [],
+            "Avg. Downtime (s)": [],
+            "Avg. Ping (ms)": [],
+            "Max. Ping (ms)": [],
+            "Downtime %": []
+        }
         for data in all_monitor_data:
             for period, stats in data['summary_stats'].items():
-                summary_rows.append({
-                    "Monitor Name": data['monitor_name'],
-                    "Period": period,
-                    "Downtime Incidents": stats['count'],
-                    "Avg. Downtime (s)": stats['avg_duration'].total_seconds(),
-                    "Avg. Ping (ms)": stats['avg_ping'],
-                    "Max. Ping (ms)": stats['max_ping'],
-                    "Downtime %": stats['percentage']
-                })
-        summary_df = pd.DataFrame(summary_rows)
-        summary_df.to_excel(writer, sheet_name='Summary', index=False)
+                summary["Monitor Name"].append(data['monitor_name'])
+                summary["Period"].append(period)
+                summary["Downtime Incidents"].append(stats['count'])
+                summary["Avg. Downtime (s)"].append(stats['avg_duration'].total_seconds())
+                summary["Avg. Ping (ms)"].append(stats['avg_ping'])
+                summary["Max. Ping (ms)"].append(stats['max_ping'])
+                summary["Downtime %"].append(stats['percentage'])
+        pd.DataFrame(summary).to_excel(writer, sheet_name='Summary', index=False)
 
         # Details Sheet
-        details_rows = []
-        for data in all_monitor_data:
-            for incident in reversed(data['downtime_incidents']):
-                details_rows.append({
-                    "Monitor Name": data['monitor_name'],
-                    "Outage Start": incident['start'].strftime('%Y-%m-%d %H:%M:%S %Z'),
-                    "Duration (s)": incident['duration'].total_seconds(),
-                    "Ongoing": incident.get("ongoing", False)
-                })
-        details_df = pd.DataFrame(details_rows)
-        details_df.to_excel(writer, sheet_name='Downtime Log', index=False)
+        _build_incident_frame(all_monitor_data).to_excel(writer, sheet_name='Downtime Log', index=False)
 
     return filename
 
@@ -297,7 +423,7 @@ def generate_pdf_header(pdf, username, selected_monitors, timezone_str):
     pdf.cell(0, 10, "Historical Status Monitor Report", align='L')
 
     pdf.set_font("Helvetica", '', 10)
-    now_aware = datetime.datetime.now(pytz.timezone(timezone_str))
+    now_aware = datetime.datetime.now(_resolve_timezone(timezone_str))
     generated_str = now_aware.strftime('%m/%d/%Y @ %H:%M:%S')
     pdf.set_xy(40, 25)
     pdf.cell(0, 8, f"Generated: {generated_str}")
@@ -348,22 +474,26 @@ def generate_details_pdf_section(pdf, incidents):
         pdf.cell(0, 8, "No downtime incidents recorded in the analyzed period.", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         return
 
-    for incident in reversed(incidents):
+    for incident in incidents:
         start_str = incident['start'].strftime('%Y-%m-%d %H:%M:%S %Z')
-        duration_str = _format_timedelta(incident['duration'])
+        duration_str = _format_timedelta(datetime.timedelta(seconds=incident['duration_s']))
 
+        if incident.get("truncated", False):
+            start_str = f"Before {start_str}"
+            duration_str = f"Over {duration_str}"
         if incident.get("ongoing", False):
             duration_str += " (Ongoing)"
 
+        # Draw both labels, then both values, so each incident needs one
+        # bold/regular font switch instead of two. Keep the rows together.
+        if pdf.will_page_break(16):
+            pdf.add_page()
+        y = pdf.get_y()
         pdf.set_font("Helvetica", 'B', 10)
-        pdf.cell(30, 8, "Outage Start:")
-        pdf.set_font("Helvetica", '', 10)
-        pdf.cell(0, 8, start_str, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
-
-        pdf.set_font("Helvetica", 'B', 10)
-        pdf.cell(30, 8, "Duration:")
+        pdf.multi_cell(30, 8, "Outage Start:\nDuration:")
+        pdf.set_xy(pdf.l_margin + 30, y)
         pdf.set_font("Helvetica", '', 10)
-        pdf.cell(0, 8, duration_str, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        pdf.multi_cell(0, 8, f"{start_str}\n{duration_str}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         pdf.ln(4)
 
 # --- Main Application Logic ---
@@ -387,6 +517,22 @@ def select_monitors(monitors):
         except (ValueError, IndexError):
             print("Error: Invalid input. Please enter numbers separated by commas.")
 
+def process_monitor(api, api_lock, monitor, timezone, period_starts):
+    """Fetches and analyzes the heartbeats of a single monitor."""
+    with api_lock:
+        print(f"  - Processing: {monitor['name']}")
+        # The server counts the lookback from the moment of the fetch
+        history_start_ns = time.time_ns() - BEAT_HISTORY_HOURS * 3600 * 10**9
+        heartbeats = api.get_monitor_beats(monitor['id'], BEAT_HISTORY_HOURS)
+    analysis_results = analyze_heartbeats(heartbeats, timezone, history_start_ns)
+    summary_stats = calculate_summary_stats(analysis_results, period_starts)
+
+    return {
+        "monitor_name": monitor['name'],
+        "summary_stats": summary_stats,
+        "downtime_incidents": analysis_results['downtime_incidents']
+    }
+
 def main():
     """Main function to run the report generation script."""
     print_banner()
@@ -411,29 +557,26 @@ def main():
                 return
 
             print("\nAnalyzing data and generating report...")
-            all_monitor_data = []
-            for monitor in selected_monitors:
-                monitor_id = monitor['id']
-                monitor_name = monitor['name']
-                print(f"  - Processing: {monitor_name}")
-
-                heartbeats = api.get_monitor_beats(monitor_id, 10000)
-                analysis_results = analyze_heartbeats(heartbeats, timezone)
-                summary_stats = calculate_summary_stats(analysis_results, timezone)
-
-                all_monitor_data.append({
-                    "monitor_name": monitor_name,
-                    "summary_stats": summary_stats,
-                    "downtime_incidents": analysis_results['downtime_incidents']
-                })
+            # The socket.io client is not thread-safe, so fetches are serialized
+            # with a lock; only the analysis of a fetched monitor overlaps with
+            # the next fetch.
+            api_lock = threading.Lock()
+            period_starts = get_period_starts()
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(process_monitor, api, api_lock, monitor, timezone, period_starts)
+                    for monitor in selected_monitors
+                ]
+                all_monitor_data = [future.result() for future in futures]
 
             # Generate the report in the chosen format
+            report_name = datetime.datetime.now().strftime("kumareport_%m_%d_%y_%H_%M_%S")
             if export_format == 'pdf':
-                filename = generate_pdf_report(username, selected_monitors, timezone, all_monitor_data)
+                filename = generate_pdf_report(username, selected_monitors, timezone, all_monitor_data, report_name + '.pdf')
             elif export_format == 'csv':
-                filename = generate_csv_report(all_monitor_data)
+                filename = generate_csv_report(all_monitor_data, report_name + '.csv')
             elif export_format == 'xlsx':
-                filename = generate_xlsx_report(all_monitor_data)
+                filename = generate_xlsx_report(all_monitor_data, report_name + '.xlsx')
 
             print(f"\nReport successfully generated: {filename}")
 